@@ -6,6 +6,7 @@
 
 """Charm the service."""
 
+import functools
 import logging
 import re
 import socket
@@ -23,6 +24,10 @@ logger = logging.getLogger(__name__)
 CONTAINER_NAME = "loki"
 LOKI_PORT = 3100
 
+# Output looks like this:
+# Loki, version 2.4.0 (branch: HEAD, revision 32137ee)
+_VERSION_RE = re.compile(r"[Vv]ersion:?\s*(\S+)")
+
 
 @trace_charm(
     tracing_endpoint="_charm_tracing_endpoint",
@@ -34,6 +39,7 @@ class LokiWorkerK8SOperatorCharm(CharmBase):
 
     def __init__(self, *args):
         super().__init__(*args)
+        self._fqdn = socket.getfqdn()
         self.worker = Worker(
             charm=self,
             name="loki",
@@ -58,26 +64,23 @@ class LokiWorkerK8SOperatorCharm(CharmBase):
 
     # === PROPERTIES === #
 
-    @property
+    @functools.cached_property
     def version(self) -> Optional[str]:
         """Return Loki workload version."""
         if not self._container.can_connect():
             return None
 
         version_output, _ = self._container.exec(["/bin/loki", "-version"]).wait_output()
-        # Output looks like this:
-        # Loki, version 2.4.0 (branch: HEAD, revision 32137ee)
-        if result := re.search(r"[Vv]ersion:?\s*(\S+)", version_output):
+        if result := _VERSION_RE.search(version_output):
             return result.group(1)
         return None
 
     # === UTILITY METHODS === #
 
-    @staticmethod
-    def readiness_check_endpoint(worker: Worker) -> str:
+    def readiness_check_endpoint(self, worker: Worker) -> str:
         """Endpoint for worker readiness checks."""
         scheme = "https" if worker.cluster.get_tls_data() else "http"
-        return f"{scheme}://{socket.getfqdn()}:{LOKI_PORT}/ready"
+        return f"{scheme}://{self._fqdn}:{LOKI_PORT}/ready"
 
     def pebble_layer(self, worker: Worker) -> Layer:
         """Return a dictionary representing a Pebble layer."""